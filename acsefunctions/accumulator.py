@@ -0,0 +1,349 @@
+"""
+Resumable Series Accumulators (acsefunctions.accumulator)
+
+This module provides stateful versions of the series in
+`acsefunctions.taylor` and `acsefunctions.bessel`. An accumulator keeps the
+partial sum and the state needed for the next term, so a result that is not
+accurate enough can be refined by adding terms instead of being recomputed
+from the start.
+
+Classes:
+- SeriesAccumulator: Base class with the shared extend/freeze logic.
+- ExpAccumulator(x): Taylor series of e^x.
+- SinAccumulator(x): Taylor series of sin(x).
+- CosAccumulator(x): Taylor series of cos(x).
+- BesselAccumulator(alpha, x): Series of the Bessel function of the first kind.
+
+Usage:
+acc = ExpAccumulator(x)
+acc.extend(50)
+while np.any(acc.error_estimate() > 1e-12):
+    acc.extend(10)
+result = acc.freeze()
+
+Notes
+- After extending to N terms the value matches the corresponding one-shot
+  function called with the same N, e.g. `exp(x, N)` or
+  `bessel_function(alpha, x, terms)`.
+- ExpAccumulator, SinAccumulator and CosAccumulator take real arguments
+  only and raise TypeError for complex ones, since the one-shot functions
+  evaluate complex arguments with a different method.
+"""
+import numpy as np
+
+from acsefunctions.bessel import _is_integer_order, gamma_function_lanczos
+
+
+def _real_argument(x):
+    """
+    Help to convert the argument of a Taylor accumulator to a real array.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) passed to the accumulator.
+
+    Returns
+    -------
+    numpy.ndarray
+        `x` as a float array.
+
+    Raises
+    ------
+    TypeError
+        If `x` is complex.
+    """
+    if np.iscomplexobj(x):
+        raise TypeError(
+            "Complex arguments are not supported by the Taylor accumulators."
+        )
+    return np.asarray(x, dtype=float)
+
+
+class SeriesAccumulator:
+    """
+    Base class for resumable series evaluations.
+
+    Subclasses set the partial sum `_sum` and the most recent term `_term`
+    and implement `_next_term`, which advances their own state by one term.
+
+    Attributes
+    ----------
+    N : int
+        The number of terms accumulated so far, counted in the same way as
+        the `N` or `terms` argument of the corresponding one-shot function.
+    frozen : bool
+        Whether the accumulator has been frozen.
+    """
+
+    def __init__(self):
+        self.frozen = False
+
+    @property
+    def value(self):
+        """
+        np.ndarray: A copy of the current partial sum.
+        """
+        return self._sum.copy()
+
+    def extend(self, n=1):
+        """
+        Add `n` more terms to the series.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of terms to add. Default is 1.
+
+        Returns
+        -------
+        SeriesAccumulator
+            The accumulator itself, so calls can be chained.
+
+        Raises
+        ------
+        RuntimeError
+            If the accumulator has been frozen.
+        """
+        if self.frozen:
+            raise RuntimeError("Cannot extend a frozen accumulator.")
+        for _ in range(n):
+            self._term = self._next_term()
+            self._sum += self._term
+            self.N += 1
+        return self
+
+    def extend_until(self, tol, max_terms=1000):
+        """
+        Add terms until the error estimate is below `tol` everywhere.
+
+        Parameters
+        ----------
+        tol : float
+            The absolute error to reach.
+        max_terms : int, optional
+            Stop once `N` reaches this number of terms. Default is 1000.
+
+        Returns
+        -------
+        SeriesAccumulator
+            The accumulator itself, so calls can be chained.
+        """
+        while self.N < max_terms and np.any(self.error_estimate() > tol):
+            self.extend()
+        return self
+
+    def error_estimate(self):
+        """
+        Estimate the truncation error of the current partial sum.
+
+        Returns
+        -------
+        np.ndarray
+            The magnitude of the most recently added term.
+        """
+        return np.abs(self._term)
+
+    def freeze(self):
+        """
+        Stop further refinement and return the result.
+
+        Returns
+        -------
+        np.ndarray
+            The final partial sum.
+        """
+        self.frozen = True
+        return self.value
+
+    def _next_term(self):
+        """
+        Help to advance the series state by one term.
+
+        Returns
+        -------
+        np.ndarray
+            The next term of the series.
+        """
+        raise NotImplementedError
+
+
+class ExpAccumulator(SeriesAccumulator):
+    """
+    Resumable Taylor series of the exponential function e^x.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) at which to evaluate e^x.
+
+    Raises
+    ------
+    TypeError
+        If `x` is complex.
+
+    Examples
+    --------
+    >>> acc = ExpAccumulator(np.array([0.0, 1.0]))
+    >>> acc.extend(5).value
+    array([1.        , 2.71666667])
+
+    >>> acc.extend(15).value
+    array([1.        , 2.71828183])
+    """
+
+    def __init__(self, x):
+        super().__init__()
+        self.x = _real_argument(x)
+        self.N = 0
+        self._sum = np.ones_like(self.x, dtype=float)
+        self._term = np.ones_like(self.x, dtype=float)
+        self._power = np.ones_like(self.x, dtype=float)
+        self._factorial = 1.0
+
+    def _next_term(self):
+        self._power *= self.x
+        self._factorial *= self.N + 1
+        return self._power / self._factorial
+
+
+class SinAccumulator(SeriesAccumulator):
+    """
+    Resumable Taylor series of the sine function sin(x).
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+
+    Raises
+    ------
+    TypeError
+        If `x` is complex.
+
+    Examples
+    --------
+    >>> SinAccumulator(np.pi / 2).extend(10).value
+    array(1.)
+    """
+
+    def __init__(self, x):
+        super().__init__()
+        x = _real_argument(x)
+        self.x = (x + np.pi) % (2 * np.pi) - np.pi
+        self.N = 1
+        self._sum = np.array(self.x, dtype=float)
+        self._term = np.array(self.x, dtype=float)
+        self._power = np.array(self.x, dtype=float)
+        self._factorial = 1.0
+        self._sign = -1.0
+
+    def _next_term(self):
+        n = 2 * self.N + 1
+        self._power *= self.x * self.x
+        self._factorial *= n * (n - 1)
+        term = self._sign * self._power / self._factorial
+        self._sign *= -1
+        return term
+
+
+class CosAccumulator(SeriesAccumulator):
+    """
+    Resumable Taylor series of the cosine function cos(x).
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+
+    Raises
+    ------
+    TypeError
+        If `x` is complex.
+
+    Examples
+    --------
+    >>> CosAccumulator(np.pi).extend(20).value
+    array(-1.)
+    """
+
+    def __init__(self, x):
+        super().__init__()
+        x = _real_argument(x)
+        self.x = (x + np.pi) % (2 * np.pi) - np.pi
+        self.N = 0
+        self._sum = np.ones_like(self.x, dtype=float)
+        self._term = np.ones_like(self.x, dtype=float)
+        self._power = np.ones_like(self.x, dtype=float)
+        self._factorial = 1.0
+        self._sign = -1.0
+
+    def _next_term(self):
+        n = 2 * self.N + 2
+        self._power *= self.x * self.x
+        self._factorial *= n * (n - 1)
+        term = self._sign * self._power / self._factorial
+        self._sign *= -1
+        return term
+
+
+class BesselAccumulator(SeriesAccumulator):
+    """
+    Resumable series of the Bessel function of the first kind.
+
+    Parameters
+    ----------
+    alpha : float
+        The order of the Bessel function.
+    x : float or np.ndarray
+        The value or array of values at which to evaluate the Bessel function.
+
+    Examples
+    --------
+    >>> BesselAccumulator(1, 2).extend(20).value
+    array([0.57672481])
+
+    Notes
+    -----
+    Each term is obtained from the previous one through the ratio
+    -(x/2)^2 / (m (m + alpha)), so only the first term needs the gamma
+    function. Integer orders stay in real arithmetic for real x and use
+    J_{-n}(x) = (-1)^n J_n(x) for negative orders.
+    """
+
+    def __init__(self, alpha, x):
+        super().__init__()
+        self.alpha = alpha
+        self.x = np.atleast_1d(x)
+        half_x = self.x / 2
+
+        if _is_integer_order(alpha):
+            self._order = abs(int(alpha))
+            self._sign = -1 if alpha < 0 and self._order % 2 == 1 else 1
+            term = np.ones_like(half_x)
+            for k in range(1, self._order + 1):
+                term *= half_x / k
+        else:
+            self._order = alpha
+            self._sign = 1
+            term = half_x.astype(np.complex128) ** alpha
+            term /= gamma_function_lanczos(alpha + 1)
+
+        self.N = 1
+        self._minus_half_x_squared = -(half_x * half_x)
+        self._term = term
+        self._sum = term.copy()
+
+    @property
+    def value(self):
+        """
+        np.ndarray: A copy of the current partial sum, real where possible.
+        """
+        result = self._sign * self._sum
+        if np.iscomplexobj(result) and np.all(np.isreal(result)):
+            return result.real
+        return result
+
+    def _next_term(self):
+        m = self.N
+        return self._term * (self._minus_half_x_squared / (m * (m + self._order)))
@@ -0,0 +1,339 @@
+"""
+Pluggable Kernel Backends (acsefunctions.backends)
+
+This module provides the dispatch layer used by the public functions in
+`acsefunctions.taylor` and `acsefunctions.bessel`. Every public function
+owns a registry of interchangeable kernels, and the kernel used for a call
+is chosen at runtime, so the fastest implementation for a deployment can be
+selected without changing any calling code.
+
+Functions:
+- register_backend(function, name): Decorator registering a kernel for a function.
+- available_backends(function): List the kernels registered for a function.
+- use_backend(name): Context manager selecting a backend for a block of code.
+- get_backend(): Return the name of the currently selected backend.
+- dispatch(function, *args, **kwargs): Call the selected kernel for a function.
+- threaded(kernel, argnum=0): Wrap a kernel so it runs over chunks in threads.
+
+Backends shipped with the package:
+- "reference" : The original series implementations.
+- "horner"    : Nested (Horner) evaluation of the same truncated series.
+- "table"     : Tabulated values corrected with a short series around the
+  nearest node, accurate to a few units in the last place.
+- "threaded"  : The reference kernel applied to chunks of the input in threads.
+- "auto"      : Time every registered kernel on the first call for a given
+  input shape and dtype, and remember the fastest one.
+
+Notes
+- The backend is taken from the innermost `use_backend` block, or else from
+  the ``ACSEFUNCTIONS_BACKEND`` environment variable, or else "reference".
+- A backend that is not registered for a particular function falls back to
+  that function's "reference" kernel.
+"""
+
+import contextlib
+import contextvars
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+DEFAULT_BACKEND = "reference"
+AUTO_BACKEND = "auto"
+ENVIRONMENT_VARIABLE = "ACSEFUNCTIONS_BACKEND"
+
+_REGISTRY = {}
+_TUNED = {}
+_SELECTED = contextvars.ContextVar("acsefunctions_backend", default=None)
+
+# Inputs smaller than this are not worth splitting across threads.
+_MIN_CHUNK_SIZE = 65536
+
+
+def register_backend(function, name):
+    """
+    Register a kernel as the `name` backend of `function`.
+
+    Parameters
+    ----------
+    function : str
+        The name of the public function the kernel implements, e.g. "exp".
+    name : str
+        The name of the backend, e.g. "horner".
+
+    Returns
+    -------
+    callable
+        A decorator that registers the kernel and returns it unchanged.
+
+    Examples
+    --------
+    >>> @register_backend("square", "reference")
+    ... def _square(x):
+    ...     return x * x
+    >>> dispatch("square", 3)
+    9
+    """
+
+    def decorator(kernel):
+        _REGISTRY.setdefault(function, {})[name] = kernel
+        _clear_tuned(function)
+        return kernel
+
+    return decorator
+
+
+def available_backends(function):
+    """
+    List the backends registered for a function.
+
+    Parameters
+    ----------
+    function : str
+        The name of the public function, e.g. "sin".
+
+    Returns
+    -------
+    list of str
+        The registered backend names, in registration order.
+
+    Raises
+    ------
+    KeyError
+        If no kernel has been registered for `function`.
+    """
+    return list(_kernels(function))
+
+
+@contextlib.contextmanager
+def use_backend(name):
+    """
+    Select the backend used by every dispatched call inside a block.
+
+    Parameters
+    ----------
+    name : str
+        The name of a registered backend, or "auto". The name is
+        validated when a dispatched function is called.
+
+    Examples
+    --------
+    >>> with use_backend("horner"):
+    ...     get_backend()
+    'horner'
+    """
+    token = _SELECTED.set(name)
+    try:
+        yield
+    finally:
+        _SELECTED.reset(token)
+
+
+def get_backend():
+    """
+    Return the name of the currently selected backend.
+
+    Returns
+    -------
+    str
+        The backend from the innermost `use_backend` block, the
+        ``ACSEFUNCTIONS_BACKEND`` environment variable, or "reference".
+    """
+    name = _SELECTED.get()
+    if name is None:
+        name = os.environ.get(ENVIRONMENT_VARIABLE, DEFAULT_BACKEND)
+    return name
+
+
+def dispatch(function, *args, **kwargs):
+    """
+    Call the kernel of `function` selected by the current backend.
+
+    Parameters
+    ----------
+    function : str
+        The name of the public function, e.g. "cos".
+    *args, **kwargs
+        The arguments passed on to the kernel.
+
+    Returns
+    -------
+    object
+        Whatever the selected kernel returns.
+
+    Raises
+    ------
+    ValueError
+        If the selected backend is not registered for any function.
+    """
+    name = get_backend()
+    kernels = _kernels(function)
+    if name == AUTO_BACKEND:
+        return _dispatch_auto(function, kernels, args, kwargs)
+    if name not in kernels:
+        _check_backend_name(name)
+        name = DEFAULT_BACKEND
+    return kernels[name](*args, **kwargs)
+
+
+def threaded(kernel, argnum=0):
+    """
+    Wrap an elementwise kernel so that it runs on chunks of its input in threads.
+
+    Parameters
+    ----------
+    kernel : callable
+        A kernel that acts elementwise on one of its array arguments.
+    argnum : int, optional
+        The position of the array argument to split. Default is 0.
+
+    Returns
+    -------
+    callable
+        A kernel with the same signature as `kernel`.
+
+    Notes
+    -----
+    NumPy releases the GIL inside its ufunc loops, so large inputs are
+    evaluated in parallel. Inputs below a minimum size are passed straight
+    to `kernel`.
+    """
+
+    def threaded_kernel(*args, **kwargs):
+        x = np.asarray(args[argnum])
+        workers = os.cpu_count() or 1
+        if workers == 1 or x.size < 2 * _MIN_CHUNK_SIZE:
+            return kernel(*args, **kwargs)
+
+        chunks = np.array_split(x.ravel(), min(workers, x.size // _MIN_CHUNK_SIZE))
+
+        def run(chunk):
+            chunk_args = list(args)
+            chunk_args[argnum] = chunk
+            return np.asarray(kernel(*chunk_args, **kwargs))
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(run, chunks))
+        return np.concatenate(results).reshape(x.shape)
+
+    threaded_kernel.__name__ = kernel.__name__ + "_threaded"
+    threaded_kernel.__doc__ = kernel.__doc__
+    return threaded_kernel
+
+
+def _kernels(function):
+    """
+    Help to look up the kernels registered for a function.
+
+    Parameters
+    ----------
+    function : str
+        The name of the public function.
+
+    Returns
+    -------
+    dict
+        Mapping of backend name to kernel.
+
+    Raises
+    ------
+    KeyError
+        If no kernel has been registered for `function`.
+    """
+    try:
+        return _REGISTRY[function]
+    except KeyError:
+        raise KeyError(f"No backends registered for '{function}'.") from None
+
+
+def _check_backend_name(name):
+    """
+    Help to reject backend names that no function knows about.
+
+    Parameters
+    ----------
+    name : str
+        The backend name to validate.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not registered for any function.
+    """
+    if not any(name in kernels for kernels in _REGISTRY.values()):
+        raise ValueError(f"Unknown backend '{name}'.")
+
+
+def _dispatch_auto(function, kernels, args, kwargs):
+    """
+    Help to run the fastest kernel for the shape and dtype of the arguments.
+
+    On the first call for a given signature every kernel is timed on the
+    actual arguments and the winner is remembered for later calls.
+
+    Parameters
+    ----------
+    function : str
+        The name of the public function.
+    kernels : dict
+        Mapping of backend name to kernel.
+    args : tuple
+        Positional arguments for the kernel.
+    kwargs : dict
+        Keyword arguments for the kernel.
+
+    Returns
+    -------
+    object
+        The result of the fastest kernel.
+    """
+    key = (function, _signature(args, kwargs))
+    name = _TUNED.get(key)
+    if name is not None:
+        return kernels[name](*args, **kwargs)
+
+    best_time = np.inf
+    for candidate, kernel in kernels.items():
+        start = time.perf_counter()
+        candidate_result = kernel(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if elapsed < best_time:
+            best_time, name, result = elapsed, candidate, candidate_result
+    _TUNED[key] = name
+    return result
+
+
+def _signature(args, kwargs):
+    """
+    Help to build the auto-tuning cache key for a set of arguments.
+
+    Parameters
+    ----------
+    args : tuple
+        Positional arguments for the kernel.
+    kwargs : dict
+        Keyword arguments for the kernel.
+
+    Returns
+    -------
+    tuple
+        The shape and dtype of every argument.
+    """
+    values = list(args) + [kwargs[key] for key in sorted(kwargs)]
+    return tuple(sorted(kwargs)) + tuple(
+        (np.shape(value), np.asarray(value).dtype.str) for value in values
+    )
+
+
+def _clear_tuned(function):
+    """
+    Help to forget auto-tuning decisions for a function.
+
+    Parameters
+    ----------
+    function : str
+        The name of the public function.
+    """
+    for key in [key for key in _TUNED if key[0] == function]:
+        del _TUNED[key]
@@ -9,6 +9,7 @@ Functions:
 - factorial(n): Compute the factorial of an integer or array of integers.
 - gamma_function_lanczos(z): Compute the gamma function using the Lanczos approximation.
 - bessel_function(alpha, x, terms=100): Compute the Bessel function of the first kind.
+- bessel_zeros(alpha, k): Compute the first k positive zeros of the Bessel function.
 
 The module is designed to be used with numpy arrays for efficient computation, especially
 for vectorized operations over arrays of numbers.
@@ -17,9 +18,16 @@ Notes
 - The functions are implemented with numerical stability and efficiency in mind.
 - The Bessel function implementation is based on its series representation and is
   most accurate for small orders and arguments.
+- `bessel_function` dispatches to a kernel selected through `acsefunctions.backends`.
 """
+import os
+import tempfile
+import zipfile
+
 import numpy as np
 
+from acsefunctions.backends import dispatch, register_backend, threaded
+
 
 def factorial(n):
     """
@@ -199,7 +207,35 @@ def bessel_function(alpha, x, terms=100):
     If the computation involves complex numbers, the
     results are returned in `np.complex128` format.
     If all values are real, the result is returned as a float.
+    Integer orders are evaluated with exact factorial ratios
+    in real arithmetic, using J_{-n}(x) = (-1)^n J_n(x) for
+    negative orders.
     """
+    return dispatch("bessel_function", alpha, x, terms)
+
+
+@register_backend("bessel_function", "reference")
+def _bessel_reference(alpha, x, terms=100):
+    """
+    Help to compute the Bessel function of the first kind from its series.
+
+    Parameters
+    ----------
+    alpha : float
+        The order of the Bessel function.
+    x : float or np.ndarray
+        The value or array of values at which to evaluate the Bessel function.
+    terms : int, optional
+        The number of terms to use in the series expansion. Default is 100.
+
+    Returns
+    -------
+    float or np.complex128
+        The approximated value of the Bessel function at x.
+    """
+    if _is_integer_order(alpha):
+        return _bessel_integer_order(int(alpha), x, terms)
+
     result = np.complex128(0.0)  # initialize as complex128
     for m in range(terms):
         term = (
@@ -212,3 +248,568 @@ def bessel_function(alpha, x, terms=100):
         return result.real
     else:
         return result
+
+
+def _is_integer_order(alpha):
+    """
+    Help to decide whether a Bessel order is a real integer.
+
+    Parameters
+    ----------
+    alpha : float
+        The order of the Bessel function.
+
+    Returns
+    -------
+    bool
+        True if `alpha` is a real scalar with an integer value.
+
+    Examples
+    --------
+    >>> _is_integer_order(2.0)
+    True
+
+    >>> _is_integer_order(0.5)
+    False
+    """
+    return bool(
+        np.ndim(alpha) == 0 and np.isrealobj(alpha) and float(alpha).is_integer()
+    )
+
+
+def _bessel_integer_order(n, x, terms=100):
+    """
+    Help to compute the Bessel function of the first kind for an integer order.
+
+    Each term of the series is obtained from the previous one through the
+    ratio -(x/2)^2 / (m (m + |n|)), so neither the gamma function nor
+    complex arithmetic is needed for real arguments.
+
+    Parameters
+    ----------
+    n : int
+        The integer order of the Bessel function.
+    x : float or np.ndarray
+        The value or array of values at which to evaluate the Bessel function.
+    terms : int, optional
+        The number of terms to use in the series expansion. Default is 100.
+
+    Returns
+    -------
+    np.ndarray
+        The approximated value of J_n at x, real for real x.
+
+    Examples
+    --------
+    >>> _bessel_integer_order(1, 2)
+    array([0.57672481])
+
+    >>> _bessel_integer_order(-1, 2)
+    array([-0.57672481])
+    """
+    order = abs(n)
+    half_x = np.atleast_1d(x) / 2
+
+    # (x/2)^|n| / |n|!, built up one factor at a time to avoid overflow
+    term = np.ones_like(half_x)
+    for k in range(1, order + 1):
+        term *= half_x / k
+
+    result = np.zeros_like(term)
+    minus_half_x_squared = -(half_x * half_x)
+    for m in range(terms):
+        if m > 0:
+            term *= minus_half_x_squared / (m * (m + order))
+        result += term
+
+    if n < 0 and order % 2 == 1:
+        result = -result
+    if np.iscomplexobj(result) and np.all(np.isreal(result)):
+        return result.real
+    return result
+
+
+def bessel_zeros(alpha, k, tol=1e-12, max_iterations=50, cache=True):
+    """
+    Compute the first k positive zeros of the Bessel function of the first kind.
+
+    Parameters
+    ----------
+    alpha : float or np.ndarray
+        The non-negative order, or a 1-D array of orders, of the Bessel function.
+    k : int
+        The number of zeros to compute for each order.
+    tol : float, optional
+        Relative size of the Newton step at which a zero is accepted.
+        Default is 1e-12.
+    max_iterations : int, optional
+        The maximum number of Newton iterations. Default is 50.
+    cache : bool, optional
+        Whether to reuse and store root tables in memory and on disk.
+        Default is True.
+
+    Returns
+    -------
+    np.ndarray
+        The zeros in increasing order, with shape (k,) for a scalar order
+        or (len(alpha), k) for an array of orders.
+
+    Raises
+    ------
+    ValueError
+        If an order is negative or k is not positive.
+    RuntimeError
+        If Newton's method does not converge to k distinct zeros.
+
+    Examples
+    --------
+    >>> bessel_zeros(0, 3, cache=False)
+    array([2.40482556, 5.52007811, 8.65372791])
+
+    >>> bessel_zeros(np.array([0.5, 1.5]), 2, cache=False)
+    array([[3.14159265, 6.28318531],
+           [4.49340946, 7.72525184]])
+
+    Notes
+    -----
+    Every zero is seeded from McMahon's expansion, which is accurate for
+    zeros far beyond the order, and from Olver's uniform expansion in terms
+    of the zeros of the Airy function, which is accurate for the first zeros
+    of large orders; the seed with the smaller Newton step is kept. All zeros
+    are then refined together with Newton iterations, using J_alpha and
+    J_(alpha+1) from a single evaluation for the value and the derivative.
+
+    Root tables are cached on disk in the directory named by the
+    ``ACSEFUNCTIONS_CACHE_DIR`` environment variable, or in
+    ``~/.cache/acsefunctions`` when it is not set. A cached table is reused
+    only if it was computed with a tolerance at least as strict as `tol`.
+    """
+    orders = np.atleast_1d(np.asarray(alpha, dtype=float))
+    if np.any(orders < 0):
+        raise ValueError("Bessel zeros are only computed for non-negative orders.")
+    if k < 1:
+        raise ValueError("The number of zeros must be positive.")
+
+    zeros = np.empty((orders.size, k))
+    missing = []
+    for i, order in enumerate(orders):
+        table = _load_zeros(order, tol) if cache else None
+        if table is not None and table.size >= k:
+            zeros[i] = table[:k]
+        else:
+            missing.append(i)
+
+    if missing:
+        zeros[missing] = _refine_zeros(orders[missing], k, tol, max_iterations)
+        if cache:
+            for i in missing:
+                _save_zeros(orders[i], zeros[i], tol)
+
+    if np.ndim(alpha) == 0:
+        return zeros[0]
+    return zeros
+
+
+_ZEROS_CACHE = {}
+
+
+def _zeros_cache_path(order):
+    """
+    Help to locate the on-disk root table for an order.
+
+    Parameters
+    ----------
+    order : float
+        The order of the Bessel function.
+
+    Returns
+    -------
+    str
+        Path of the ``.npz`` file holding the zeros for `order` and the
+        tolerance they were computed with.
+    """
+    directory = os.environ.get(
+        "ACSEFUNCTIONS_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "acsefunctions"),
+    )
+    return os.path.join(directory, f"bessel_zeros_{float(order)!r}.npz")
+
+
+def _load_zeros(order, tol):
+    """
+    Help to fetch a cached root table from memory or disk.
+
+    Parameters
+    ----------
+    order : float
+        The order of the Bessel function.
+    tol : float
+        The tolerance the caller asks for.
+
+    Returns
+    -------
+    np.ndarray or None
+        The cached zeros, or None if none are cached with a tolerance at
+        least as strict as `tol`.
+    """
+    order = float(order)
+    if order not in _ZEROS_CACHE:
+        try:
+            with np.load(_zeros_cache_path(order)) as table:
+                _ZEROS_CACHE[order] = (float(table["tol"]), table["zeros"])
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # missing or unreadable tables are recomputed and overwritten
+            return None
+
+    cached_tol, zeros = _ZEROS_CACHE[order]
+    if cached_tol > tol:
+        return None
+    return zeros
+
+
+def _save_zeros(order, zeros, tol):
+    """
+    Help to store a root table in memory and, if possible, on disk.
+
+    The file is written to a temporary name and then moved into place.
+
+    Parameters
+    ----------
+    order : float
+        The order of the Bessel function.
+    zeros : np.ndarray
+        The converged zeros to store.
+    tol : float
+        The tolerance the zeros were computed with.
+    """
+    order = float(order)
+    _ZEROS_CACHE[order] = (float(tol), np.array(zeros))
+    path = _zeros_cache_path(order)
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                np.savez(stream, zeros=zeros, tol=tol)
+            # the table appears in one step, so readers never see it half written
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+    except OSError:
+        # the disk cache is an optimisation only
+        pass
+
+
+def _mcmahon_zeros(orders, k):
+    """
+    Help to estimate Bessel zeros from McMahon's asymptotic expansion.
+
+    Parameters
+    ----------
+    orders : np.ndarray
+        1-D array of orders.
+    k : int
+        The number of zeros per order.
+
+    Returns
+    -------
+    np.ndarray
+        Estimated zeros with shape (len(orders), k).
+
+    Examples
+    --------
+    >>> _mcmahon_zeros(np.array([0.5]), 2)
+    array([[3.14159265, 6.28318531]])
+    """
+    mu = 4 * orders[:, np.newaxis] ** 2
+    beta = (np.arange(1, k + 1) + orders[:, np.newaxis] / 2 - 0.25) * np.pi
+    eight_beta = 8 * beta
+    return (
+        beta
+        - (mu - 1) / eight_beta
+        - 4 * (mu - 1) * (7 * mu - 31) / (3 * eight_beta**3)
+        - 32 * (mu - 1) * (83 * mu**2 - 982 * mu + 3779) / (15 * eight_beta**5)
+    )
+
+
+def _olver_zeros(orders, k):
+    """
+    Help to estimate Bessel zeros from Olver's uniform expansion.
+
+    Parameters
+    ----------
+    orders : np.ndarray
+        1-D array of orders.
+    k : int
+        The number of zeros per order.
+
+    Returns
+    -------
+    np.ndarray
+        Estimated zeros with shape (len(orders), k).
+
+    Notes
+    -----
+    Uses j_(alpha,s) ~ alpha + |a_s| (alpha/2)^(1/3)
+    + (3/20) a_s^2 (alpha/2)^(-1/3), where a_s is the s-th zero of the Airy
+    function. For s = 1 this is alpha + 1.8558 alpha^(1/3) + 1.0332 alpha^(-1/3).
+    """
+    # asymptotic expansion of the Airy zeros, accurate to 1e-5 for s = 1
+    t = 3 * np.pi * (4 * np.arange(1, k + 1) - 1) / 8
+    airy = t ** (2 / 3) * (1 + 5 / (48 * t**2) - 5 / (36 * t**4))
+
+    half_order = np.maximum(orders[:, np.newaxis], 1e-3) / 2
+    return (
+        2 * half_order
+        + airy * half_order ** (1 / 3)
+        + 0.15 * airy**2 * half_order ** (-1 / 3)
+    )
+
+
+def _refine_zeros(orders, k, tol=1e-12, max_iterations=50):
+    """
+    Help to compute Bessel zeros with Newton's method.
+
+    Parameters
+    ----------
+    orders : np.ndarray
+        1-D array of orders.
+    k : int
+        The number of zeros per order.
+    tol : float, optional
+        Relative Newton step at which a zero is accepted. Default is 1e-12.
+    max_iterations : int, optional
+        The maximum number of Newton iterations. Default is 50.
+
+    Returns
+    -------
+    np.ndarray
+        Zeros with shape (len(orders), k).
+
+    Raises
+    ------
+    RuntimeError
+        If the iterations do not converge to k distinct, increasing zeros
+        above the order.
+    """
+    alpha = np.broadcast_to(orders[:, np.newaxis], (orders.size, k))
+
+    # keep whichever seed Newton's method would move the least
+    seeds = [_mcmahon_zeros(orders, k), _olver_zeros(orders, k)]
+    steps = [np.abs(_newton_step(alpha, seed)) for seed in seeds]
+    x = np.where(steps[0] <= steps[1], seeds[0], seeds[1])
+
+    converged = np.zeros(x.shape, dtype=bool)
+    for _ in range(max_iterations):
+        step = _newton_step(alpha, x)
+        x -= step
+        converged = np.abs(step) <= tol * x
+        if np.all(converged):
+            break
+
+    # consecutive zeros are always more than 2.5 apart
+    distinct = np.all(np.diff(x, axis=1) > 2.5) and np.all(x[:, 0] > orders)
+    if not (np.all(converged) and distinct):
+        raise RuntimeError(
+            "Newton's method did not converge to the zeros of the Bessel function."
+        )
+    return x
+
+
+def _newton_step(alpha, x):
+    """
+    Help to compute the Newton step J_alpha(x) / J_alpha'(x).
+
+    Parameters
+    ----------
+    alpha : np.ndarray
+        Non-negative orders, broadcastable against `x`.
+    x : np.ndarray
+        Positive arguments.
+
+    Returns
+    -------
+    np.ndarray
+        The Newton step, using J_alpha' = (alpha / x) J_alpha - J_(alpha+1).
+    """
+    value, next_value = _bessel_pair(alpha, x)
+    return value / (alpha / x * value - next_value)
+
+
+def _bessel_pair(alpha, x):
+    """
+    Help to evaluate J_alpha(x) and J_(alpha+1)(x) accurately.
+
+    Parameters
+    ----------
+    alpha : np.ndarray
+        Non-negative orders, broadcastable against `x`.
+    x : np.ndarray
+        Non-negative arguments.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        The values J_alpha(x) and J_(alpha+1)(x).
+
+    Notes
+    -----
+    Hankel's asymptotic expansion is used wherever its smallest term is
+    below 1e-16, which needs x to be well beyond alpha^2 / 4. Everywhere
+    else the values come from Miller's backward recurrence, which unlike
+    the power series does not lose accuracy to cancellation for large x.
+    """
+    alpha, x = np.broadcast_arrays(
+        np.asarray(alpha, dtype=float), np.asarray(x, dtype=float)
+    )
+    value = np.empty_like(x)
+    next_value = np.empty_like(x)
+
+    zero = x == 0
+    value[zero] = alpha[zero] == 0
+    next_value[zero] = 0.0
+
+    asymptotic = ~zero
+    if np.any(asymptotic):
+        order = alpha[asymptotic]
+        positive_x = x[asymptotic]
+        current, error = _bessel_asymptotic(order, positive_x)
+        following, next_error = _bessel_asymptotic(order + 1, positive_x)
+        accurate = np.maximum(error, next_error) < 1e-16
+        asymptotic[asymptotic] = accurate
+        value[asymptotic] = current[accurate]
+        next_value[asymptotic] = following[accurate]
+
+    recurrence = ~(zero | asymptotic)
+    if np.any(recurrence):
+        value[recurrence], next_value[recurrence] = _bessel_miller(
+            alpha[recurrence], x[recurrence]
+        )
+
+    return value, next_value
+
+
+def _bessel_miller(alpha, x):
+    """
+    Help to evaluate J_alpha(x) and J_(alpha+1)(x) by backward recurrence.
+
+    Parameters
+    ----------
+    alpha : np.ndarray
+        1-D array of non-negative orders.
+    x : np.ndarray
+        1-D array of positive arguments, the same length as `alpha`.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        The values J_alpha(x) and J_(alpha+1)(x).
+
+    Notes
+    -----
+    With nu = alpha - floor(alpha), the recurrence
+    J_(nu+n-1) = (2 (nu+n) / x) J_(nu+n) - J_(nu+n+1) is run downwards from
+    an index well above both alpha and x, and the result is normalised with
+    (x/2)^nu = sum over k of (nu+2k) Gamma(nu+k) / k! J_(nu+2k)(x).
+    """
+    nu = alpha - np.floor(alpha)
+    index = np.floor(alpha).astype(int)
+
+    top = float(np.max(np.maximum(alpha + 1, x)))
+    start = int(top + 30 + np.sqrt(40 * top))
+    start += start % 2
+
+    # normalisation weights w_k = (nu+2k) Gamma(nu+k) / k!, all multiples of Gamma(nu+1)
+    gamma = np.where(nu == 0, 1.0, np.real(gamma_function_lanczos(nu + 1)))
+    weights = np.empty((start // 2 + 1, nu.size))
+    weights[0] = gamma
+    ratio = gamma
+    for m in range(1, start // 2 + 1):
+        if m > 1:
+            ratio = ratio * (nu + m - 1) / m
+        weights[m] = (nu + 2 * m) * ratio
+
+    following = np.zeros_like(x)
+    current = np.full_like(x, 1e-30)
+    total = np.zeros_like(x)
+    value = np.zeros_like(x)
+    next_value = np.zeros_like(x)
+    for n in range(start, -1, -1):
+        # current = f(nu+n), following = f(nu+n+1)
+        if n % 2 == 0:
+            total += weights[n // 2] * current
+        value = np.where(index == n, current, value)
+        next_value = np.where(index + 1 == n, current, next_value)
+        if n == 0:
+            break
+        current, following = 2 * (nu + n) / x * current - following, current
+
+        # rescale where the unnormalised values threaten to overflow
+        large = np.abs(current) > 1e200
+        if np.any(large):
+            scale = np.where(large, 1e-200, 1.0)
+            current *= scale
+            following *= scale
+            total *= scale
+            value *= scale
+            next_value *= scale
+
+    normalisation = (x / 2) ** nu / total
+    return value * normalisation, next_value * normalisation
+
+
+def _bessel_asymptotic(alpha, x, terms=60):
+    """
+    Help to evaluate J_alpha(x) from Hankel's asymptotic expansion.
+
+    Parameters
+    ----------
+    alpha : np.ndarray
+        Orders, broadcastable against `x`.
+    x : np.ndarray
+        Large positive arguments.
+    terms : int, optional
+        The maximum number of terms of the expansion. Default is 60.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        The approximated values of J_alpha(x), and the size of the first
+        omitted term relative to the leading one, which estimates the
+        relative truncation error.
+
+    Notes
+    -----
+    The divergent expansion is truncated separately for every element
+    just before its terms start growing.
+    """
+    mu = 4 * np.asarray(alpha, dtype=float) ** 2
+    omega = x - (alpha / 2 + 0.25) * np.pi
+
+    p = np.zeros_like(x)
+    q = np.zeros_like(x)
+    coefficient = np.ones_like(x)
+    previous = np.full_like(x, np.inf)
+    active = np.ones(x.shape, dtype=bool)
+    error = np.zeros_like(x)
+    for n in range(terms):
+        if n > 0:
+            coefficient = coefficient * (mu - (2 * n - 1) ** 2) / (8 * n * x)
+        term = coefficient if n % 4 < 2 else -coefficient
+        stopped = active & ~(np.abs(term) < np.abs(previous))
+        error = np.where(stopped, np.abs(term), error)
+        active &= ~stopped
+        previous = term
+        if n % 2 == 0:
+            p += np.where(active, term, 0.0)
+        else:
+            q += np.where(active, term, 0.0)
+    error = np.where(active, np.abs(previous), error)
+
+    values = np.sqrt(2 / (np.pi * x)) * (p * np.cos(omega) - q * np.sin(omega))
+    return values, error
+
+
+register_backend("bessel_function", "threaded")(threaded(_bessel_reference, argnum=1))
@@ -4,8 +4,8 @@ Taylor Series Approximations of Common Functions.
 ================================================
 
 Provides functions for approximating mathematical functions
-(e.g., e^x, sin(x), cos(x), tan(x))
-using their Taylor series expansions.
+(e.g., e^x, sin(x), cos(x)) using their Taylor series
+expansions, and tan(x) using a continued fraction.
 
 Main Functions:
 - exp  : Approximates the exponential function.
@@ -13,12 +13,21 @@ Main Functions:
 - cos  : Approximates the cosine function.
 - tan  : Approximates the tangent function.
 
+Each function dispatches to a kernel selected through
+`acsefunctions.backends`; the "reference" kernels below accumulate the
+series term by term, the "horner" kernels evaluate the same truncated
+series in nested form and the "table" kernels correct tabulated values
+with a short series around the nearest node. Complex inputs are handled
+by separate vectorized kernels that build on the same real series.
+
 Usage:
 from taylor_approximations import exp, sin, cos, tan
 """
 
 import numpy as np
 
+from acsefunctions.backends import dispatch, register_backend, threaded
+
 
 def exp(x, N=200):
     """
@@ -26,7 +35,7 @@ def exp(x, N=200):
 
     Parameters
     ----------
-    x : float or numpy.ndarray
+    x : float, complex or numpy.ndarray
         The value (or array of values) at which to evaluate
         the exponential function.
     N : int, optional
@@ -48,6 +57,34 @@ def exp(x, N=200):
 
     >>> exp(np.array([0, 1]))
     array([1.        , 2.71828183])
+
+    Notes
+    -----
+    For complex x = a + ib the result is e^a (cos(b) + i sin(b)), with
+    e^|a| = 2^n e^r for |r| <= ln(2)/2, the N-term series used for e^r,
+    and b reduced to [-pi, pi].
+    """
+    if np.iscomplexobj(x):
+        return dispatch("complex_exp", x, N)
+    return dispatch("exp", x, N)
+
+
+@register_backend("exp", "reference")
+def _exp_reference(x, N=200):
+    """
+    Help to approximate e^x by accumulating the Taylor series term by term.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) at which to evaluate e^x.
+    N : int, optional
+        The number of terms in the Taylor series expansion. Default is 200.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of e^x.
     """
     x = np.asarray(x)
 
@@ -69,7 +106,7 @@ def sin(x, N=20):
 
     Parameters
     ----------
-    x : float or numpy.ndarray
+    x : float, complex or numpy.ndarray
         The value (or array of values) in radians at which to
         evaluate the sine function.
     N : int, optional
@@ -87,6 +124,33 @@ def sin(x, N=20):
 
     >>> sin(np.array([0, np.pi/2, np.pi]))
     array([ 0.00000000e+00,  1.00000000e+00, -3.45866918e-16])
+
+    Notes
+    -----
+    For complex x = a + ib the result is
+    sin(a) cosh(b) + i cos(a) sinh(b), with a reduced to [-pi, pi].
+    """
+    if np.iscomplexobj(x):
+        return dispatch("complex_sin", x, N)
+    return dispatch("sin", x, N)
+
+
+@register_backend("sin", "reference")
+def _sin_reference(x, N=20):
+    """
+    Help to approximate sin(x) by accumulating the Taylor series term by term.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The number of terms in the Taylor series expansion. Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of sin(x).
     """
     x = np.asarray(x, dtype=float)
     x = (x + np.pi) % (2 * np.pi) - np.pi
@@ -111,7 +175,7 @@ def cos(x, N=20):
 
     Parameters
     ----------
-    x : float or numpy.ndarray
+    x : float, complex or numpy.ndarray
         The value (or array of values) in radians at which
         to evaluate the cosine function.
     N : int, optional
@@ -129,6 +193,33 @@ def cos(x, N=20):
 
     >>> cos(np.array([0, np.pi/2, np.pi]))
     array([ 1.00000000e+00,  4.26446037e-17, -1.00000000e+00])
+
+    Notes
+    -----
+    For complex x = a + ib the result is
+    cos(a) cosh(b) - i sin(a) sinh(b), with a reduced to [-pi, pi].
+    """
+    if np.iscomplexobj(x):
+        return dispatch("complex_cos", x, N)
+    return dispatch("cos", x, N)
+
+
+@register_backend("cos", "reference")
+def _cos_reference(x, N=20):
+    """
+    Help to approximate cos(x) by accumulating the Taylor series term by term.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The number of terms in the Taylor series expansion. Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of cos(x).
     """
     x = np.asarray(x, dtype=float)
     x = (x + np.pi) % (2 * np.pi) - np.pi
@@ -150,16 +241,15 @@ def cos(x, N=20):
 
 def tan(x, N=20):
     """
-    Approximate the tangent function tan(x) using Taylor series.
+    Approximate the tangent function tan(x) using a continued fraction.
 
     Parameters
     ----------
-    x : float or numpy.ndarray
+    x : float, complex or numpy.ndarray
         The value (or array of values) in radians at which
         to evaluate the tangent function.
     N : int, optional
-        The number of terms in the Taylor series expansion for
-        sin(x) and cos(x). Default is 20.
+        The depth of the continued fraction. Default is 20.
 
     Returns
     -------
@@ -176,15 +266,643 @@ def tan(x, N=20):
 
     Notes
     -----
-    The function computes tan(x) by dividing the Taylor series
-    approximations of sin(x) and cos(x).
-    This may lead to inaccuracies or errors when cos(x) is close to zero.
+    The argument is reduced to r in [-pi/4, pi/4] with x = r + k*pi/2, and
+    tan(r) is evaluated from Lambert's continued fraction
+    tan(r) = r / (1 - r^2 / (3 - r^2 / (5 - ...))).
+    For odd k the identity tan(x) = -cot(r) is used, so values close to
+    the asymptotes stay accurate. Where r is within 1e-10 of a pole the
+    result is NaN.
+    For complex x = a + ib the result is
+    (tan(a) + i tanh(b)) / (1 - i tan(a) tanh(b)).
+    """
+    if np.iscomplexobj(x):
+        return dispatch("complex_tan", x, N)
+    return dispatch("tan", x, N)
+
+
+# pi/2 split so that k * _PI_OVER_TWO_HIGH is exact for moderate k
+_PI_OVER_TWO_HIGH = 1.57079632673412561417e00
+_PI_OVER_TWO_LOW = 6.07710050650619224932e-11
+
+
+@register_backend("tan", "reference")
+def _tan_reference(x, N=20):
+    """
+    Help to approximate tan(x) from a range-reduced continued fraction.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The depth of the continued fraction. Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of tan(x), with NaN
+        where x is within 1e-10 of a pole.
+    """
+    r, denominator, odd = _tan_continued_fraction(x, N)
+
+    # tan(r) = r / denominator and cot(r) = denominator / r
+    pole = odd & (np.abs(r) < 1e-10)
+    numerator = np.where(odd, -denominator, r)
+    denominator = np.where(pole, np.nan, np.where(odd, r, denominator))
+
+    return numerator / denominator
+
+
+def _tan_continued_fraction(x, N):
+    """
+    Help to reduce angles by multiples of pi/2 and evaluate tan on the remainder.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int
+        The depth of the continued fraction.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The remainder r in [-pi/4, pi/4], the continued fraction d with
+        tan(r) = r / d, and a mask that is True where x lies in an odd
+        quadrant, so that tan(x) = -cot(r) = -d / r.
+    """
+    x = np.array(x, dtype=float)
+
+    k = np.rint(x / (np.pi / 2))
+    r = (x - k * _PI_OVER_TWO_HIGH) - k * _PI_OVER_TWO_LOW
+    r_squared = r * r
+
+    # evaluate the continued fraction from the innermost level outwards;
+    # depths 0 and 1 both give tan(r) = r
+    denominator = np.full_like(r, max(2 * N - 1, 1))
+    for n in range(N - 2, -1, -1):
+        denominator = (2 * n + 1) - r_squared / denominator
+
+    return r, denominator, k % 2 != 0
+
+
+@register_backend("exp", "horner")
+def _exp_horner(x, N=200):
+    """
+    Help to approximate e^x by evaluating the Taylor series in nested form.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) at which to evaluate e^x.
+    N : int, optional
+        The number of terms in the Taylor series expansion. Default is 200.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of e^x.
+
+    Notes
+    -----
+    Uses e^x = 1 + x(1 + x/2(1 + x/3(...(1 + x/N)))), which needs one
+    multiply-add per term and no separate power or factorial.
+    """
+    x = np.asarray(x)
+
+    result = np.ones_like(x, dtype=float)
+    for n in range(N, 0, -1):
+        result *= x
+        result /= n
+        result += 1.0
+
+    return result
+
+
+@register_backend("sin", "horner")
+def _sin_horner(x, N=20):
+    """
+    Help to approximate sin(x) by evaluating the Taylor series in nested form.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The number of terms in the Taylor series expansion. Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of sin(x).
+    """
+    x = np.asarray(x, dtype=float)
+    x = (x + np.pi) % (2 * np.pi) - np.pi
+    x_squared = x * x
+
+    result = np.ones_like(x, dtype=float)
+    for k in range(N - 1, 0, -1):
+        result *= x_squared
+        result /= -(2 * k) * (2 * k + 1)
+        result += 1.0
+
+    return x * result
+
+
+@register_backend("cos", "horner")
+def _cos_horner(x, N=20):
+    """
+    Help to approximate cos(x) by evaluating the Taylor series in nested form.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The number of terms in the Taylor series expansion. Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of cos(x).
+    """
+    x = np.asarray(x, dtype=float)
+    x = (x + np.pi) % (2 * np.pi) - np.pi
+    x_squared = x * x
+
+    result = np.ones_like(x, dtype=float)
+    for k in range(N, 0, -1):
+        result *= x_squared
+        result /= -(2 * k - 1) * (2 * k)
+        result += 1.0
+
+    return result
+
+
+def _even_odd_series(x, N, sign):
+    """
+    Help to sum the even and odd parts of the exponential series in one pass.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Real values at which to evaluate the series.
+    N : int
+        The even part runs up to x^(2N) and the odd part up to x^(2N-1).
+    sign : float
+        -1.0 for cos(x) and sin(x), which are the real and imaginary parts
+        of e^(ix); 1.0 for cosh(x) and sinh(x).
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The even part and the odd part of the series.
+
+    Examples
+    --------
+    >>> _even_odd_series(np.array([0.0, np.pi / 2]), 20, -1.0)[1]
+    array([0., 1.])
+    """
+    x = np.array(x, dtype=float)
+    even = np.ones_like(x)
+    odd = x.copy()
+    term = x.copy()
+
+    for n in range(2, 2 * N + 1):
+        term *= x
+        term /= n
+        if n % 2 == 0:
+            if sign < 0:
+                np.negative(term, out=term)
+            even += term
+        else:
+            odd += term
+
+    return even, odd
+
+
+# ln(2) split so that n * _LN_TWO_HIGH is exact for |n| < 2048
+_LN_TWO_HIGH = 6.93147180369123816490e-01
+_LN_TWO_LOW = 1.90821492927058770002e-10
+
+
+def _exp_reduced(x, N=20):
+    """
+    Help to compute e^x for real x of any size from a short series.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Real values.
+    N : int, optional
+        The number of terms in the Taylor series of e^r. Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated values of e^x.
+
+    Notes
+    -----
+    Each e^x is written as 2^n e^r with |r| <= ln(2)/2, so the series is
+    accurate for every element, however large, and no power or factorial
+    overflows.
+    """
+    x = np.array(x, dtype=float)
+    n = np.rint(np.fmax(np.fmin(x, 1000.0), -1000.0) / _LN_TWO_HIGH)
+    r = (x - n * _LN_TWO_HIGH) - n * _LN_TWO_LOW
+    return np.ldexp(np.asarray(exp(r, N)), n.astype(int))
+
+
+def _cosh_sinh(x):
+    """
+    Help to compute cosh(x) and sinh(x) from one evaluation of e^|x|.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Real values.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        cosh(x) and sinh(x).
+
+    Notes
+    -----
+    cosh and sinh follow from e^|x| and its reciprocal. For |x| < 1 the
+    difference in sinh would cancel, so a short series of cosh and sinh is
+    used there.
+    """
+    x = np.array(x, dtype=float)
+    magnitude = np.abs(x)
+    growing = _exp_reduced(magnitude)
+    decaying = 1 / growing
+
+    small = magnitude < 1
+    cosh_small, sinh_small = _even_odd_series(np.where(small, x, 0.0), 10, 1.0)
+    cosh_x = np.where(small, cosh_small, (growing + decaying) / 2)
+    sinh_x = np.where(small, sinh_small, np.copysign((growing - decaying) / 2, x))
+    return cosh_x, sinh_x
+
+
+def _reduce(x):
+    """
+    Help to reduce real angles to [-pi, pi].
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Angles in radians.
+
+    Returns
+    -------
+    numpy.ndarray
+        The angles shifted by multiples of 2*pi into [-pi, pi]. Angles
+        already in that range are returned unchanged, without rounding.
+    """
+    return np.where(np.abs(x) > np.pi, (x + np.pi) % (2 * np.pi) - np.pi, x)
+
+
+@register_backend("complex_exp", "reference")
+def _exp_complex(x, N=200):
+    """
+    Help to approximate e^x for complex x.
+
+    Parameters
+    ----------
+    x : complex or numpy.ndarray
+        The value (or array of values) at which to evaluate e^x.
+    N : int, optional
+        The number of terms in the Taylor series of e^r, where
+        e^|Re x| = 2^n e^r with |r| <= ln(2)/2. Default is 200.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of e^x.
+    """
+    x = np.asarray(x, dtype=np.complex128)
+    cos_imag, sin_imag = _even_odd_series(_reduce(x.imag), 20, -1.0)
+
+    # e^(-a) = 1 / e^a avoids the cancellation of the series for negative a
+    magnitude = _exp_reduced(np.abs(x.real), N)
+    magnitude = np.where(x.real < 0, 1 / magnitude, magnitude)
+
+    result = np.empty_like(x)
+    result.real = magnitude * cos_imag
+    result.imag = magnitude * sin_imag
+    return result
+
+
+@register_backend("complex_sin", "reference")
+def _sin_complex(x, N=20):
+    """
+    Help to approximate sin(x) for complex x.
+
+    Parameters
+    ----------
+    x : complex or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The number of terms in the Taylor series of sin(Re x) and
+        cos(Re x). Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of sin(x).
+    """
+    x = np.asarray(x, dtype=np.complex128)
+    cos_real, sin_real = _even_odd_series(_reduce(x.real), N, -1.0)
+    cosh_imag, sinh_imag = _cosh_sinh(x.imag)
+
+    result = np.empty_like(x)
+    result.real = sin_real * cosh_imag
+    result.imag = cos_real * sinh_imag
+    return result
+
+
+@register_backend("complex_cos", "reference")
+def _cos_complex(x, N=20):
+    """
+    Help to approximate cos(x) for complex x.
+
+    Parameters
+    ----------
+    x : complex or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The number of terms in the Taylor series of sin(Re x) and
+        cos(Re x). Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of cos(x).
+    """
+    x = np.asarray(x, dtype=np.complex128)
+    cos_real, sin_real = _even_odd_series(_reduce(x.real), N, -1.0)
+    cosh_imag, sinh_imag = _cosh_sinh(x.imag)
+
+    result = np.empty_like(x)
+    result.real = cos_real * cosh_imag
+    result.imag = -sin_real * sinh_imag
+    return result
+
+
+@register_backend("complex_tan", "reference")
+def _tan_complex(x, N=20):
+    """
+    Help to approximate tan(x) for complex x.
+
+    Parameters
+    ----------
+    x : complex or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        The depth of the continued fraction for tan(Re x). Default is 20.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of tan(x).
+
+    Notes
+    -----
+    With t = tan(a) and h = tanh(b) for x = a + ib,
+    tan(x) = (t (1 - h^2) + i h (1 + t^2)) / (1 + t^2 h^2), which keeps the
+    accuracy of the real kernel close to the poles. Where a lies in an odd
+    quadrant, t = -1/T with T = tan(r) for the reduced angle r, and the same
+    expression becomes (-T (1 - h^2) + i h (1 + T^2)) / (T^2 + h^2), which
+    stays finite at the poles of tan(a) and gives i/h there. |b| is capped
+    at 20, beyond which tanh(b) equals +-1 to double precision.
+    """
+    x = np.asarray(x, dtype=np.complex128)
+    r, continued_fraction, odd = _tan_continued_fraction(x.real, N)
+    t = r / continued_fraction
+    cosh_imag, sinh_imag = _cosh_sinh(np.clip(x.imag, -20.0, 20.0))
+    h = sinh_imag / cosh_imag
+
+    t_squared = t * t
+    h_squared = h * h
+    # only a real pole, where T = h = 0, is left undefined
+    pole = odd & (np.abs(r) < 1e-10) & (h == 0)
+    denominator = np.where(odd, t_squared + h_squared, 1 + t_squared * h_squared)
+    denominator = np.where(pole, np.nan, denominator)
+
+    result = np.empty_like(x)
+    result.real = np.where(odd, -t, t) * (1 - h_squared) / denominator
+    result.imag = h * (1 + t_squared) / denominator
+    return result
+
+
+# sin and cos are tabulated at j*pi/128 over a full period, and 2^(j/64)
+_SIN_TABLE_SIZE = 256
+_TABLE_STEP = 2 * np.pi / _SIN_TABLE_SIZE
+_TABLE_STEP_HIGH = _PI_OVER_TWO_HIGH / 64
+_TABLE_STEP_LOW = _PI_OVER_TWO_LOW / 64
+_EXP_TABLE_SIZE = 64
+
+
+def _sin_cos_tables():
+    """
+    Help to tabulate sin and cos at the nodes j*pi/128 for 0 <= j < 256.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        sin and cos at the nodes, accurate to about one unit in the last
+        place.
+
+    Notes
+    -----
+    Each node is split as q*pi/2 + t with |t| <= pi/4. sin(t) and cos(t)
+    come from the series at the rounded t, corrected to first order for
+    the rounding, and are then rotated into quadrant q.
+    """
+    nodes = np.arange(_SIN_TABLE_SIZE)
+    quadrant = np.rint(nodes / 64)
+    offset = nodes - 64 * quadrant
+    t = offset * _TABLE_STEP_HIGH
+    rounding = offset * _TABLE_STEP_LOW
+    cos_t, sin_t = _even_odd_series(t, 20, -1.0)
+    cos_t, sin_t = cos_t - rounding * sin_t, sin_t + rounding * cos_t
+
+    quadrant = np.mod(quadrant, 4)
+    swap = quadrant % 2 == 1
+    sin_table = np.where(swap, cos_t, sin_t)
+    cos_table = np.where(swap, -sin_t, cos_t)
+    sign = np.where(quadrant >= 2, -1.0, 1.0)
+    return sign * sin_table, sign * cos_table
+
+
+_SIN_TABLE, _COS_TABLE = _sin_cos_tables()
+_EXP_TABLE = _exp_reference(
+    np.arange(_EXP_TABLE_SIZE) * (np.log(2) / _EXP_TABLE_SIZE), 30
+)
+
+
+def _table_lookup(x):
+    """
+    Help to evaluate sin(x) and cos(x) from the tables.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        sin(x), cos(x), the table index j and the offset d, with
+        x = j*pi/128 + d modulo 2*pi.
+
+    Notes
+    -----
+    With |d| <= pi/256, sin(x) = sin(t_j) + sin(t_j) (cos(d) - 1)
+    + cos(t_j) sin(d), and likewise for cos(x). sin(d) and cos(d) - 1
+    come from four-term series whose truncation error is below 1e-20, so
+    the results are within a few units in the last place while
+    k * pi/128 is exact, that is for |x| below about 1e5.
     """
     x = np.array(x, dtype=float)
+    k = np.rint(x / _TABLE_STEP)
+    d = (x - k * _TABLE_STEP_HIGH) - k * _TABLE_STEP_LOW
+    j = np.mod(k, _SIN_TABLE_SIZE).astype(int)
+
+    d_squared = d * d
+    sin_d = d * (1 - d_squared / 6 * (1 - d_squared / 20 * (1 - d_squared / 42)))
+    cos_d_minus_one = (
+        -d_squared
+        / 2
+        * (1 - d_squared / 12 * (1 - d_squared / 30 * (1 - d_squared / 56)))
+    )
+
+    sin_t = _SIN_TABLE[j]
+    cos_t = _COS_TABLE[j]
+    sin_x = sin_t + (sin_t * cos_d_minus_one + cos_t * sin_d)
+    cos_x = cos_t + (cos_t * cos_d_minus_one - sin_t * sin_d)
+    return sin_x, cos_x, j, d
+
+
+@register_backend("sin", "table")
+def _sin_table(x, N=20):
+    """
+    Help to approximate sin(x) from tabulated values of sin and cos.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        Unused; accepted so the kernel can stand in for the others. The
+        accuracy is fixed by the table.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of sin(x).
+    """
+    return _table_lookup(x)[0]
 
-    s = sin(x, N)
-    c = cos(x, N)
 
-    c = np.where(np.abs(c) < 1e-10, np.nan, c)
+@register_backend("cos", "table")
+def _cos_table(x, N=20):
+    """
+    Help to approximate cos(x) from tabulated values of sin and cos.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        Unused; accepted so the kernel can stand in for the others. The
+        accuracy is fixed by the table.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of cos(x).
+    """
+    return _table_lookup(x)[1]
+
+
+@register_backend("tan", "table")
+def _tan_table(x, N=20):
+    """
+    Help to approximate tan(x) from tabulated values of sin and cos.
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) in radians.
+    N : int, optional
+        Unused; accepted so the kernel can stand in for the others. The
+        accuracy is fixed by the table.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of tan(x), with NaN
+        where x is within 1e-10 of a pole.
+
+    Notes
+    -----
+    The nearest node to a pole is the pole itself, where cos(t_j) = 0 and
+    cos(x) = -sin(t_j) sin(d) keeps its full relative accuracy.
+    """
+    sin_x, cos_x, j, d = _table_lookup(x)
+    pole = (j % 128 == 64) & (np.abs(d) < 1e-10)
+    return sin_x / np.where(pole, np.nan, cos_x)
+
+
+@register_backend("exp", "table")
+def _exp_table(x, N=200):
+    """
+    Help to approximate e^x from tabulated values of 2^(j/64).
+
+    Parameters
+    ----------
+    x : float or numpy.ndarray
+        The value (or array of values) at which to evaluate e^x.
+    N : int, optional
+        Unused; accepted so the kernel can stand in for the others. The
+        accuracy is fixed by the table.
+
+    Returns
+    -------
+    numpy.ndarray
+        The approximated value (or array of values) of e^x, within a few
+        units in the last place.
+
+    Notes
+    -----
+    x is written as (64 n + j) ln(2)/64 + d with 0 <= j < 64 and
+    |d| <= ln(2)/128, so e^x = 2^n 2^(j/64) e^d, where e^d comes from a
+    six-term series whose truncation error is below 1e-19.
+    """
+    x = np.array(x, dtype=float)
 
-    return s / c
+    # the low 21 bits of _LN_TWO_HIGH are zero, so k * _LN_TWO_HIGH / 64 is exact
+    clipped = np.fmax(np.fmin(x, 1000.0), -1000.0)
+    k = np.rint(clipped * (_EXP_TABLE_SIZE / np.log(2)))
+    d = (x - k * (_LN_TWO_HIGH / _EXP_TABLE_SIZE)) - k * (_LN_TWO_LOW / _EXP_TABLE_SIZE)
+    n, j = np.divmod(k.astype(int), _EXP_TABLE_SIZE)
+
+    exp_d_minus_one = d * (
+        1 + d / 2 * (1 + d / 3 * (1 + d / 4 * (1 + d / 5 * (1 + d / 6))))
+    )
+    table = _EXP_TABLE[j]
+    result = np.ldexp(table + table * exp_d_minus_one, n)
+    return np.where(x == -np.inf, 0.0, result)
+
+
+register_backend("exp", "threaded")(threaded(_exp_reference))
+register_backend("sin", "threaded")(threaded(_sin_reference))
+register_backend("cos", "threaded")(threaded(_cos_reference))
+register_backend("tan", "threaded")(threaded(_tan_reference))
+register_backend("complex_exp", "threaded")(threaded(_exp_complex))
+register_backend("complex_sin", "threaded")(threaded(_sin_complex))
+register_backend("complex_cos", "threaded")(threaded(_cos_complex))
+register_backend("complex_tan", "threaded")(threaded(_tan_complex))
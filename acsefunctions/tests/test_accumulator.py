@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+from scipy.special import jv as scipy_bessel
+from acsefunctions.accumulator import ExpAccumulator, SinAccumulator
+from acsefunctions.accumulator import CosAccumulator, BesselAccumulator
+from acsefunctions.taylor import exp, sin, cos
+from acsefunctions.bessel import bessel_function
+
+
+class TestTaylorAccumulators:
+    """
+    Test cases for the resumable Taylor series.
+
+    This class checks that refining an accumulator in steps gives the
+    same result as the one-shot functions called with the same N.
+    """
+
+    x = np.linspace(-5, 5, 21)
+
+    def test_exp_matches_exp(self):
+        acc = ExpAccumulator(self.x)
+        for N in [5, 10, 40, 200]:
+            acc.extend(N - acc.N)
+            np.testing.assert_array_equal(acc.value, exp(self.x, N))
+
+    def test_sin_matches_sin(self):
+        acc = SinAccumulator(self.x)
+        for N in [3, 8, 20]:
+            acc.extend(N - acc.N)
+            np.testing.assert_array_equal(acc.value, sin(self.x, N))
+
+    def test_cos_matches_cos(self):
+        acc = CosAccumulator(self.x)
+        for N in [3, 8, 20]:
+            acc.extend(N - acc.N)
+            np.testing.assert_array_equal(acc.value, cos(self.x, N))
+
+    def test_2d_input(self):
+        x = np.random.rand(3, 4)
+        assert np.allclose(ExpAccumulator(x).extend(30).value, np.exp(x))
+        assert np.allclose(SinAccumulator(x).extend(20).value, np.sin(x))
+
+    def test_extend_until(self):
+        acc = CosAccumulator(self.x).extend_until(1e-14)
+        assert np.all(acc.error_estimate() <= 1e-14)
+        assert np.allclose(acc.value, np.cos(self.x), atol=1e-13)
+
+    def test_extend_until_max_terms(self):
+        acc = ExpAccumulator(self.x).extend_until(0.0, max_terms=25)
+        assert acc.N == 25
+
+    def test_error_estimate_decreases(self):
+        acc = ExpAccumulator(2.0).extend(10)
+        first = acc.error_estimate()
+        assert acc.extend(5).error_estimate() < first
+
+    def test_freeze(self):
+        acc = SinAccumulator(self.x).extend(10)
+        result = acc.freeze()
+        np.testing.assert_array_equal(result, sin(self.x, 11))
+        with pytest.raises(RuntimeError, match="frozen"):
+            acc.extend()
+
+    @pytest.mark.parametrize(
+        "accumulator", [ExpAccumulator, SinAccumulator, CosAccumulator]
+    )
+    def test_complex_input_rejected(self, accumulator):
+        with pytest.raises(TypeError, match="Complex arguments"):
+            accumulator(np.array([1 + 1j, 2.0]))
+
+    def test_value_is_a_copy(self):
+        acc = ExpAccumulator(self.x)
+        value = acc.value
+        value[:] = 0
+        assert np.all(acc.value == 1)
+
+
+class TestBesselAccumulator:
+    """
+    Test cases for the resumable Bessel series.
+    """
+
+    x = np.linspace(0, 8, 17)
+
+    @pytest.mark.parametrize("alpha", [0, 1, 2, -3, 0.5, 2.5])
+    def test_matches_bessel_function(self, alpha):
+        acc = BesselAccumulator(alpha, self.x)
+        for terms in [5, 20, 60]:
+            acc.extend(terms - acc.N)
+            np.testing.assert_allclose(
+                acc.value, bessel_function(alpha, self.x, terms), atol=1e-13
+            )
+
+    def test_real_for_integer_order(self):
+        acc = BesselAccumulator(1, self.x).extend(30)
+        assert acc.value.dtype == np.float64
+
+    def test_extend_until(self):
+        acc = BesselAccumulator(0, self.x).extend_until(1e-16)
+        np.testing.assert_allclose(acc.freeze(), scipy_bessel(0, self.x), atol=1e-13)
@@ -0,0 +1,148 @@
+import pytest
+import numpy as np
+from acsefunctions import backends
+from acsefunctions.backends import available_backends, dispatch, get_backend
+from acsefunctions.backends import register_backend, use_backend
+from acsefunctions.taylor import sin, cos, tan, exp
+from acsefunctions.bessel import bessel_function
+
+
+class TestSelection:
+    """
+    Test cases for choosing a backend.
+
+    This class checks the precedence of the context manager, the
+    environment variable and the default, and the handling of
+    unknown backend names.
+    """
+
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv(backends.ENVIRONMENT_VARIABLE, raising=False)
+        assert get_backend() == "reference"
+
+    def test_environment_variable(self, monkeypatch):
+        monkeypatch.setenv(backends.ENVIRONMENT_VARIABLE, "horner")
+        assert get_backend() == "horner"
+
+    def test_context_manager_overrides_environment(self, monkeypatch):
+        monkeypatch.setenv(backends.ENVIRONMENT_VARIABLE, "horner")
+        with use_backend("threaded"):
+            assert get_backend() == "threaded"
+        assert get_backend() == "horner"
+
+    def test_nested_context_managers(self):
+        with use_backend("horner"):
+            with use_backend("threaded"):
+                assert get_backend() == "threaded"
+            assert get_backend() == "horner"
+
+    def test_unknown_backend(self):
+        with use_backend("no-such-backend"):
+            with pytest.raises(ValueError, match="Unknown backend"):
+                exp(1)
+
+    def test_unknown_function(self):
+        with pytest.raises(KeyError, match="No backends registered"):
+            dispatch("no-such-function", 1)
+
+    def test_missing_kernel_falls_back_to_reference(self):
+        # bessel_function has no "horner" kernel
+        with use_backend("horner"):
+            np.testing.assert_allclose(bessel_function(1, 2), [0.57672481])
+
+    def test_available_backends(self):
+        for name in ["exp", "sin", "cos"]:
+            assert {"reference", "horner", "table", "threaded"} <= set(
+                available_backends(name)
+            )
+        assert {"reference", "table", "threaded"} <= set(available_backends("tan"))
+        assert "reference" in available_backends("bessel_function")
+
+
+class TestKernels:
+    """
+    Test cases comparing every registered kernel against NumPy.
+    """
+
+    @pytest.mark.parametrize("backend", ["reference", "horner", "table", "threaded"])
+    def test_taylor_functions(self, backend):
+        x = np.linspace(-10, 10, 101)
+        with use_backend(backend):
+            assert np.allclose(exp(x), np.exp(x))
+            assert np.allclose(sin(x), np.sin(x))
+            assert np.allclose(cos(x), np.cos(x))
+            assert np.allclose(tan(np.array([0, np.pi / 6])), np.tan([0, np.pi / 6]))
+
+    def test_horner_matches_reference(self):
+        x = np.random.rand(3, 4) * 4 - 2
+        for function in [exp, sin, cos]:
+            with use_backend("horner"):
+                result = function(x, 10)
+            np.testing.assert_allclose(result, function(x, 10), rtol=1e-12)
+
+    def test_table_accuracy(self):
+        x = np.random.uniform(-1000, 1000, 10000)
+        with use_backend("table"):
+            np.testing.assert_allclose(sin(x), np.sin(x), rtol=0, atol=1e-15)
+            np.testing.assert_allclose(cos(x), np.cos(x), rtol=0, atol=1e-15)
+            np.testing.assert_allclose(tan(x), np.tan(x), rtol=1e-14)
+            np.testing.assert_allclose(exp(x / 2), np.exp(x / 2), rtol=1e-15)
+
+    def test_table_poles(self):
+        x = np.array([np.pi / 2, -np.pi / 2, np.pi / 2 + 1e-8])
+        with use_backend("table"):
+            result = tan(x)
+        assert np.all(np.isnan(result[:2]))
+        assert np.isclose(result[2], np.tan(x[2]), rtol=1e-12)
+
+    def test_threaded_large_input(self, monkeypatch):
+        monkeypatch.setattr(backends, "_MIN_CHUNK_SIZE", 8)
+        x = np.random.rand(7, 9) * 2 * np.pi
+        with use_backend("threaded"):
+            result = sin(x)
+            bessel = bessel_function(0, x)
+        assert result.shape == x.shape
+        assert np.allclose(result, np.sin(x))
+        np.testing.assert_allclose(bessel, bessel_function(0, x))
+
+
+class TestAutoTuning:
+    """
+    Test cases for the "auto" backend.
+    """
+
+    def test_remembers_winner(self, monkeypatch):
+        monkeypatch.setattr(backends, "_REGISTRY", dict(backends._REGISTRY))
+        monkeypatch.setattr(backends, "_TUNED", {})
+        calls = []
+
+        @register_backend("auto_probe", "reference")
+        def _probe_reference(x):
+            calls.append("reference")
+            return x
+
+        @register_backend("auto_probe", "fast")
+        def _probe_fast(x):
+            calls.append("fast")
+            return x
+
+        with use_backend("auto"):
+            dispatch("auto_probe", np.zeros(3))
+            assert sorted(calls) == ["fast", "reference"]
+            winner = backends._TUNED[
+                ("auto_probe", backends._signature((np.zeros(3),), {}))
+            ]
+            calls.clear()
+            dispatch("auto_probe", np.ones(3))
+            assert calls == [winner]
+
+            # a new shape is tuned again
+            calls.clear()
+            dispatch("auto_probe", np.zeros(4))
+            assert len(calls) == 2
+
+    def test_auto_results(self):
+        x = np.linspace(-3, 3, 11)
+        with use_backend("auto"):
+            assert np.allclose(exp(x), np.exp(x))
+            assert np.allclose(exp(x), np.exp(x))
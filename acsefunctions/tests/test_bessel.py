@@ -2,9 +2,12 @@ import pytest
 import numpy as np
 from scipy.special import gamma as scipy_gamma
 from scipy.special import jv as scipy_bessel
+from scipy.special import jn_zeros as scipy_bessel_zeros
+from acsefunctions import bessel
 from acsefunctions.bessel import factorial
 from acsefunctions.bessel import gamma_function_lanczos
 from acsefunctions.bessel import bessel_function
+from acsefunctions.bessel import bessel_zeros
 
 
 class TestFactorial:
@@ -148,3 +151,163 @@ class TestBesselFunction:
         result = bessel_function(alpha, -x)
         expected = (-1) ** alpha * bessel_function(alpha, x)
         np.testing.assert_allclose(result, expected)
+
+    def test_bessel_function_integer_orders(self):
+        """
+        Test the integer-order path against scipy's Bessel function,
+        including negative orders and integer-valued floats.
+        """
+        x = np.linspace(-10, 10, 41)
+        for alpha in [0, 1, 2, 5, -1, -2, -3, 3.0, np.int64(4)]:
+            result = bessel_function(alpha, x)
+            np.testing.assert_allclose(result, scipy_bessel(alpha, x), atol=1e-12)
+
+    def test_bessel_function_integer_order_is_real(self):
+        """
+        Test that integer orders with real arguments stay in float64.
+        """
+        for alpha in [0, 1, 2, -2]:
+            assert bessel_function(alpha, np.linspace(0, 5, 6)).dtype == np.float64
+            assert bessel_function(alpha, 1.5).dtype == np.float64
+
+    def test_bessel_function_negative_integer_order(self):
+        """
+        Test the reflection J_{-n}(x) = (-1)^n J_n(x).
+        """
+        x = np.random.rand(5) * 10
+        for n in range(1, 6):
+            np.testing.assert_allclose(
+                bessel_function(-n, x), (-1) ** n * bessel_function(n, x)
+            )
+
+
+class TestBesselZeros:
+    """
+    Test suite for bessel_zeros.
+    """
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """
+        Point the root cache at a temporary directory.
+        """
+        monkeypatch.setenv("ACSEFUNCTIONS_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(bessel, "_ZEROS_CACHE", {})
+        return tmp_path
+
+    def test_integer_orders(self):
+        """
+        Test bessel_zeros against scipy's zeros for integer orders.
+        """
+        for alpha in range(6):
+            np.testing.assert_allclose(
+                bessel_zeros(alpha, 20), scipy_bessel_zeros(alpha, 20), rtol=1e-11
+            )
+
+    def test_large_orders(self):
+        """
+        Test bessel_zeros against scipy's zeros for larger orders.
+        """
+        for alpha in (8, 15, 30):
+            np.testing.assert_allclose(
+                bessel_zeros(alpha, 20), scipy_bessel_zeros(alpha, 20), rtol=1e-11
+            )
+
+    def test_half_integer_order(self):
+        """
+        Test the zeros of J_{1/2}, which are the multiples of pi.
+        """
+        np.testing.assert_allclose(
+            bessel_zeros(0.5, 10), np.pi * np.arange(1, 11), rtol=1e-11
+        )
+
+    def test_zeros_are_roots(self):
+        """
+        Test that bessel_function vanishes at the computed zeros.
+        """
+        zeros = bessel_zeros(1.3, 4)
+        np.testing.assert_allclose(bessel_function(1.3, zeros), 0, atol=1e-10)
+
+    def test_batched_orders(self):
+        """
+        Test that an array of orders gives one row of zeros per order.
+        """
+        orders = np.array([0, 1, 2.5])
+        zeros = bessel_zeros(orders, 5)
+        assert zeros.shape == (3, 5)
+        for order, row in zip(orders, zeros):
+            np.testing.assert_allclose(row, bessel_zeros(order, 5, cache=False))
+
+    def test_disk_cache(self, cache_dir, monkeypatch):
+        """
+        Test that root tables are written to disk and reused.
+        """
+        expected = bessel_zeros(2, 8)
+        assert len(list(cache_dir.glob("*.npz"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("zeros should come from the cache")
+
+        monkeypatch.setattr(bessel, "_ZEROS_CACHE", {})
+        monkeypatch.setattr(bessel, "_refine_zeros", fail)
+        np.testing.assert_array_equal(bessel_zeros(2, 5), expected[:5])
+
+    def test_unreadable_cache_file(self, cache_dir):
+        """
+        Test that a corrupt root table is recomputed and replaced.
+        """
+        path = cache_dir / "bessel_zeros_0.0.npz"
+        path.write_bytes(b"not a table")
+        np.testing.assert_allclose(
+            bessel_zeros(0, 4), scipy_bessel_zeros(0, 4), rtol=1e-11
+        )
+        with np.load(path) as table:
+            np.testing.assert_array_equal(table["zeros"], bessel_zeros(0, 4))
+        assert [file.name for file in cache_dir.iterdir()] == [path.name]
+
+    def test_cache_extended(self):
+        """
+        Test that asking for more zeros than are cached recomputes them.
+        """
+        bessel_zeros(0, 3)
+        zeros = bessel_zeros(0, 6)
+        assert zeros.size == 6
+        np.testing.assert_allclose(zeros, scipy_bessel_zeros(0, 6), rtol=1e-11)
+
+    def test_cache_respects_tolerance(self, monkeypatch):
+        """
+        Test that a table computed with a looser tolerance is not reused.
+        """
+        bessel_zeros(1, 4, tol=1e-4)
+        calls = []
+        refine_zeros = bessel._refine_zeros
+
+        def record(*args, **kwargs):
+            calls.append(args)
+            return refine_zeros(*args, **kwargs)
+
+        monkeypatch.setattr(bessel, "_refine_zeros", record)
+        np.testing.assert_allclose(
+            bessel_zeros(1, 4, tol=1e-12), scipy_bessel_zeros(1, 4), rtol=1e-11
+        )
+        assert len(calls) == 1
+        bessel_zeros(1, 4, tol=1e-6)
+        assert len(calls) == 1
+
+    def test_no_convergence(self, cache_dir):
+        """
+        Ensure unconverged zeros raise and are not cached.
+        """
+        with pytest.raises(RuntimeError, match="did not converge"):
+            bessel_zeros(3, 5, max_iterations=0)
+        assert not list(cache_dir.glob("*.npz"))
+        assert not bessel._ZEROS_CACHE
+
+    def test_invalid_arguments(self):
+        """
+        Ensure bessel_zeros rejects negative orders and non-positive k.
+        """
+        with pytest.raises(ValueError, match="non-negative orders"):
+            bessel_zeros(-1, 3)
+        with pytest.raises(ValueError, match="must be positive"):
+            bessel_zeros(0, 0)
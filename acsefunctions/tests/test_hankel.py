@@ -0,0 +1,131 @@
+import pytest
+import numpy as np
+from acsefunctions.hankel import HankelTransform
+
+
+def gaussian_pair(alpha, r, k):
+    """
+    Return r^alpha exp(-r^2/2) and its order-alpha Hankel transform.
+    """
+    return r**alpha * np.exp(-(r**2) / 2), k**alpha * np.exp(-(k**2) / 2)
+
+
+class TestMatrixMethod:
+    """
+    Test cases for the kernel-matrix Hankel transform.
+
+    The transforms are checked against the self-reciprocal pair
+    r^alpha exp(-r^2/2) <-> k^alpha exp(-k^2/2).
+    """
+
+    r = np.linspace(0, 12, 801)
+    k = np.linspace(0, 5, 51)
+
+    @pytest.mark.parametrize("alpha", [0, 1, 2, 0.5])
+    def test_gaussian(self, alpha):
+        f, expected = gaussian_pair(alpha, self.r, self.k)
+        result = HankelTransform(alpha, self.r, self.k).transform(f)
+        np.testing.assert_allclose(result, expected, atol=5e-5)
+
+    @pytest.mark.parametrize("alpha", [8, 12])
+    def test_gaussian_large_order(self, alpha):
+        f, expected = gaussian_pair(alpha, self.r, self.k)
+        result = HankelTransform(alpha, self.r, self.k).transform(f)
+        np.testing.assert_allclose(result, expected, atol=1e-6 * expected.max())
+
+    def test_negative_order(self):
+        # r^(alpha+2) exp(-r^2/2) <-> (2 (alpha+1) - k^2) k^alpha exp(-k^2/2)
+        alpha, k = -0.5, self.k[1:]
+        f = self.r ** (alpha + 2) * np.exp(-(self.r**2) / 2)
+        expected = (2 * (alpha + 1) - k**2) * k**alpha * np.exp(-(k**2) / 2)
+        result = HankelTransform(alpha, self.r, k).transform(f)
+        np.testing.assert_allclose(result, expected, atol=5e-5)
+
+    def test_kernel_shape(self):
+        transform = HankelTransform(1, self.r, self.k)
+        assert transform.kernel.shape == (self.k.size, self.r.size)
+
+    def test_batch(self):
+        f, expected = gaussian_pair(1, self.r, self.k)
+        signals = np.stack([f, 2 * f, -f]).reshape(3, 1, -1)
+        result = HankelTransform(1, self.r, self.k).transform(signals)
+        assert result.shape == (3, 1, self.k.size)
+        np.testing.assert_allclose(
+            result[:, 0], [expected, 2 * expected, -expected], atol=1e-8
+        )
+
+    def test_float32_kernel(self):
+        f, expected = gaussian_pair(1, self.r, self.k)
+        transform = HankelTransform(1, self.r, self.k, dtype=np.float32)
+        assert transform.kernel.dtype == np.float32
+        result = transform.transform(f)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+
+    def test_complex_signal(self):
+        f, expected = gaussian_pair(1, self.r, self.k)
+        transform = HankelTransform(1, self.r, self.k, dtype=np.float32)
+        result = transform.transform(f + 2j * f)
+        assert result.dtype == np.complex64
+        np.testing.assert_allclose(result, expected + 2j * expected, atol=1e-5)
+
+    def test_memory_mapped_kernel(self, tmp_path):
+        path = tmp_path / "kernel.npy"
+        transform = HankelTransform(1, self.r, self.k, mmap_path=str(path))
+        assert isinstance(transform.kernel, np.memmap)
+        np.testing.assert_array_equal(np.load(path), transform.kernel)
+
+    def test_missing_k(self):
+        with pytest.raises(ValueError, match="needs an output grid"):
+            HankelTransform(0, self.r)
+
+    def test_wrong_signal_length(self):
+        transform = HankelTransform(0, self.r, self.k)
+        with pytest.raises(ValueError, match="do not match"):
+            transform.transform(np.ones(10))
+
+
+class TestFFTLogMethod:
+    """
+    Test cases for the FFTLog Hankel transform on log-spaced grids.
+    """
+
+    r = np.logspace(-6, 4, 512)
+
+    @pytest.mark.parametrize("alpha, bias", [(0, -0.5), (1, 0), (2.5, 0)])
+    def test_gaussian(self, alpha, bias):
+        transform = HankelTransform(alpha, self.r, method="fftlog", bias=bias)
+        f, expected = gaussian_pair(alpha, self.r, transform.k)
+        result = transform.transform(f)
+        inside = (transform.k > 1e-2) & (transform.k < 10)
+        np.testing.assert_allclose(result[inside], expected[inside], atol=1e-5)
+
+    @pytest.mark.parametrize("low_ringing", [True, False])
+    def test_dense_grid(self, low_ringing):
+        r = np.logspace(-4, 4, 8192)
+        transform = HankelTransform(1, r, method="fftlog", low_ringing=low_ringing)
+        f, expected = gaussian_pair(1, r, transform.k)
+        result = transform.transform(f)
+        assert np.all(np.isfinite(transform.k))
+        inside = (transform.k > 1e-2) & (transform.k < 10)
+        np.testing.assert_allclose(result[inside], expected[inside], atol=1e-6)
+
+    def test_no_kernel_matrix(self):
+        transform = HankelTransform(0, self.r, method="fftlog")
+        assert transform.kernel is None
+        assert isinstance(transform.kr, float)
+        assert transform.k.shape == self.r.shape
+
+    def test_batch(self):
+        transform = HankelTransform(1, self.r, method="fftlog")
+        f, _ = gaussian_pair(1, self.r, transform.k)
+        result = transform.transform(np.stack([f, 3 * f]))
+        np.testing.assert_allclose(result[1], 3 * result[0], atol=1e-12)
+
+    def test_linear_grid_rejected(self):
+        with pytest.raises(ValueError, match="logarithmically spaced"):
+            HankelTransform(0, np.linspace(1, 10, 64), method="fftlog")
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError, match="Unknown method"):
+            HankelTransform(0, self.r, method="quadrature")
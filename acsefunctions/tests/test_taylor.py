@@ -19,6 +19,11 @@ class TestSin:
     def test_pi(self):
         assert np.allclose(sin(np.pi), np.array([0.0]))
 
+    def test_shallow_depth(self):
+        assert np.allclose(tan(0.5, N=0), 0.5)
+        assert np.allclose(tan(0.5, N=1), 0.5)
+        assert np.allclose(tan(0.5 + 0j, N=0), 0.5)
+
     def test_pi_over_four(self):
         assert np.allclose(sin(np.pi / 4), np.array([np.sqrt(2) / 2]))
 
@@ -119,6 +124,22 @@ class TestTan:
         # cos(π/2) is zero, so tan should be undefined or very large
         assert np.isnan(tan(np.pi / 2))
 
+    def test_tan_near_poles(self):
+        # the cot identity keeps values accurate close to the asymptotes
+        for offset in [1e-3, 1e-6, 1e-8]:
+            for x in [np.pi / 2 - offset, -np.pi / 2 + offset, 3 * np.pi / 2 + offset]:
+                assert np.isclose(tan(x), np.tan(x), rtol=1e-9, atol=0)
+
+    def test_tan_matches_numpy(self):
+        x = np.linspace(-20, 20, 1001)
+        assert np.allclose(tan(x), np.tan(x), rtol=1e-12, atol=1e-14)
+
+    def test_tan_poles_are_nan(self):
+        x = np.array([-np.pi / 2, np.pi / 2, 3 * np.pi / 2, 0.3])
+        result = tan(x)
+        assert np.all(np.isnan(result[:3]))
+        assert np.isclose(result[3], np.tan(0.3))
+
 
 class TestExp:
     """
@@ -173,3 +194,66 @@ class TestExp:
             assert np.allclose(
                 exp(x), expected
             ), f"exp function should handle array of shape {shape}."
+
+
+class TestComplex:
+    """
+    Test cases for complex arguments.
+
+    This class compares `exp`, `sin`, `cos` and `tan` on complex grids
+    against NumPy, relative to the magnitude of the exact values.
+    """
+
+    z = (np.linspace(-20, 20, 41)[:, None] + 1j * np.linspace(-5, 5, 21)).ravel()
+
+    def test_exp(self):
+        result = exp(self.z)
+        assert result.dtype == np.complex128
+        assert np.allclose(result, np.exp(self.z), rtol=1e-12, atol=0)
+
+    def test_exp_large_real_part(self):
+        z = np.array([50 + 1j, -100 + 1j, 100 - 2j, 200 + 0.5j, -700 + 3j])
+        assert np.allclose(exp(z), np.exp(z), rtol=1e-12, atol=0)
+
+    def test_sin(self):
+        assert np.allclose(sin(self.z), np.sin(self.z), rtol=1e-12, atol=0)
+
+    def test_cos(self):
+        assert np.allclose(cos(self.z), np.cos(self.z), rtol=1e-12, atol=0)
+
+    def test_tan(self):
+        assert np.allclose(tan(self.z), np.tan(self.z), rtol=1e-12, atol=1e-15)
+
+    def test_tan_at_real_poles(self):
+        z = np.array([np.pi / 2 + 1j, -np.pi / 2 + 1j, 3 * np.pi / 2 - 2j])
+        expected = np.array([1j, 1j, -1j]) / np.tanh([1.0, 1.0, 2.0])
+        assert np.allclose(tan(z), expected, rtol=1e-12, atol=1e-15)
+
+    def test_tan_large_imaginary_part(self):
+        assert np.allclose(tan(np.array([0.5 + 300j, 0.5 - 300j])), [1j, -1j])
+
+    def test_large_imaginary_part(self):
+        z = np.array([1 + 100j, -2 - 300j])
+        assert np.allclose(sin(z), np.sin(z), rtol=1e-12, atol=0)
+        assert np.allclose(cos(z), np.cos(z), rtol=1e-12, atol=0)
+
+    def test_mixed_imaginary_parts(self):
+        z = np.array([0.3 + 1e-8j, 1 - 0.5j, 2 + 1.5j, -1 + 40j, 0.5 - 700j])
+        assert np.allclose(sin(z), np.sin(z), rtol=1e-12, atol=0)
+        assert np.allclose(cos(z), np.cos(z), rtol=1e-12, atol=0)
+
+    def test_small_arguments(self):
+        z = np.array([1e-12j, 1e-12 + 1e-12j])
+        assert np.allclose(sin(z), z, rtol=1e-12, atol=0)
+
+    def test_scalar(self):
+        assert np.isclose(sin(1 + 1j), np.sin(1 + 1j))
+        assert np.isclose(exp(1j * np.pi), -1)
+
+    def test_2d_array(self):
+        z = np.random.rand(3, 4) + 1j * np.random.rand(3, 4)
+        assert sin(z).shape == (3, 4)
+        assert np.allclose(cos(z), np.cos(z))
+
+    def test_real_input_stays_real(self):
+        assert sin(np.array([0.5, 1.0])).dtype == np.float64